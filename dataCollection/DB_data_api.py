@@ -1,43 +1,57 @@
-from flask import Flask, request, jsonify
-from astrapy.db import AstraDB
+from fastapi import FastAPI, Response
+from fastapi.responses import ORJSONResponse
+from astrapy.db import AsyncAstraDB, AsyncAstraDBCollection
+from typing import Optional
+from cachetools import TTLCache
 import os
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
-app = Flask(__name__)
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Initialize the Astra DB client
-db = AstraDB(
+db = AsyncAstraDB(
     token=os.getenv("ASTRA_DB_APPLICATION_TOKEN"),
     api_endpoint=os.getenv("ASTRA_DB_API_ENDPOINT")
 )
 
-@app.route('/get_data', methods=['GET'])
-def get_data():
-    # Get the channel_id from query parameters
-    channel_id = request.args.get('channel_id')
-    
+# Share one collection handle across requests instead of building it per call
+collection = AsyncAstraDBCollection(collection_name="data", astra_db=db)
+
+# Recently served documents, so dashboard refreshes of the same channel skip
+# the database. Handlers all run on the event loop thread, so no lock is needed
+CACHE_TTL_SECONDS = 60
+document_cache = TTLCache(maxsize=1024, ttl=CACHE_TTL_SECONDS)
+
+@app.get('/get_data')
+async def get_data(response: Response, channel_id: Optional[str] = None):
+    # channel_id comes from the query string
     if not channel_id:
-        return jsonify({"error": "channel_id parameter is required"}), 400
+        return ORJSONResponse({"error": "channel_id parameter is required"}, status_code=400)
+
+    response.headers["Cache-Control"] = f"max-age={CACHE_TTL_SECONDS}"
+    cached = document_cache.get(channel_id)
+    if cached is not None:
+        return cached
 
-    # Define your collection name
-    collection_name = "data"
-    
     try:
-        # Get the collection
-        collection = db.collection(collection_name)
-        
-        # Query the collection
-        results = collection.find(
+        # Only the first matching document is used, so ask the server for just one
+        result = await collection.find_one(
             {"channel_id": channel_id}
         )
         
-        return results["data"]["documents"][0]
+        document = result["data"]["document"]
+        if document is None:
+            return ORJSONResponse({"error": f"No data found for channel_id {channel_id}"}, status_code=404)
+        
+        document_cache[channel_id] = document
+        return document
     
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return ORJSONResponse({"error": str(e)}, status_code=500)
 
 if __name__ == '__main__':
-    app.run(debug=True)
\ No newline at end of file
+    import uvicorn
+    uvicorn.run("DB_data_api:app", reload=True)
\ No newline at end of file
@@ -0,0 +1,281 @@
+import asyncio
+import importlib.util
+import httpx
+import diskcache
+from contextlib import aclosing
+from datetime import datetime, timedelta
+import re
+import functools
+from cachetools import LRUCache, cached
+from cachetools.keys import hashkey
+from typing import Optional, Dict, List, AsyncIterator
+
+YOUTUBE_API_URL = 'https://youtube.googleapis.com/youtube/v3/'
+MAX_CONCURRENT_REQUESTS = 20  # Cap on videos.list requests in flight at once
+VIDEOS_PER_REQUEST = 50  # Maximum number of IDs videos.list accepts per call
+VIDEO_PARTS = 'statistics,snippet,contentDetails'
+
+# HTTP/2 needs the optional h2 package (httpx[http2]); fall back to HTTP/1.1 without it
+HTTP2_AVAILABLE = importlib.util.find_spec('h2') is not None
+
+_DUR_RE = re.compile(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?')
+
+@functools.lru_cache(maxsize=4096)
+def _is_short_duration(duration: str) -> bool:
+    """Check if video duration is less than 60 seconds (Short)."""
+    match = _DUR_RE.match(duration)
+    if match:
+        hours, minutes, seconds = (int(group or 0) for group in match.groups())
+        total_seconds = hours * 3600 + minutes * 60 + seconds
+        return total_seconds <= 60
+    return False
+
+# Shared on-disk cache for channel ID lookups and ETag-tagged API responses.
+# Identifier lookups are also cached in memory. Both layers key on the bare
+# identifier, never the client, so results are shared across clients and runs
+_cache = diskcache.Cache('.yt_cache')
+CHANNEL_ID_CACHE_TTL = 86400
+ETAG_CACHE_TTL = 7 * 86400
+ETAG_CACHED_ENDPOINTS = ('videos', 'channels')
+
+class _ChannelNotFound(Exception):
+    """Raised by the cached lookups so that misses are never cached."""
+
+@cached(LRUCache(maxsize=1024), key=lambda client, username: hashkey(username))
+@_cache.memoize(expire=CHANNEL_ID_CACHE_TTL, ignore={0})
+def _lookup_channel_id_from_username(client: httpx.Client, username: str) -> str:
+    """Resolve a legacy username to a channel ID."""
+    resp = client.get('channels', params={
+        'part': 'id',
+        'forUsername': username
+    })
+    resp.raise_for_status()
+    response = resp.json()
+    
+    if response['items']:
+        return response['items'][0]['id']
+    raise _ChannelNotFound(username)
+
+@cached(LRUCache(maxsize=1024), key=lambda client, handle: hashkey(handle))
+@_cache.memoize(expire=CHANNEL_ID_CACHE_TTL, ignore={0})
+def _lookup_channel_id_from_handle(client: httpx.Client, handle: str) -> str:
+    """Resolve a handle (@username) to a channel ID."""
+    resp = client.get('search', params={
+        'part': 'snippet',
+        'q': f'@{handle}',
+        'type': 'channel',
+        'maxResults': 1
+    })
+    resp.raise_for_status()
+    response = resp.json()
+    
+    if response['items']:
+        return response['items'][0]['snippet']['channelId']
+    raise _ChannelNotFound(handle)
+
+class YouTubeClient:
+    def __init__(self, api_key: str, include_live_details: bool = False):
+        """Initialize YouTube API client.
+        
+        Live and upcoming broadcasts are detected from the snippet alone. Set
+        include_live_details to also request liveStreamingDetails, which marks
+        past live streams as Live too at the cost of a larger payload.
+        """
+        self.api_key = api_key
+        self.video_parts = VIDEO_PARTS + (',liveStreamingDetails' if include_live_details else '')
+        self.client = httpx.Client(base_url=YOUTUBE_API_URL, params={'key': api_key})
+    
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        self.client.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def get_channel_id(self, identifier: str) -> Optional[str]:
+        """Extract channel ID from username, handle, or channel URL."""
+        if 'youtube.com' in identifier:
+            if '/channel/' in identifier:
+                return identifier.split('/channel/')[1].split('/')[0]
+            elif '/c/' in identifier or '/user/' in identifier:
+                username = identifier.split('/')[-1]
+                return self._get_channel_id_from_username(username)
+            elif '/@' in identifier:
+                handle = identifier.split('/@')[1].split('/')[0]
+                return self._get_channel_id_from_handle(handle)
+        elif identifier.startswith('@'):
+            return self._get_channel_id_from_handle(identifier[1:])
+        else:
+            return self._get_channel_id_from_username(identifier)
+        return None
+    
+    def _get_channel_id_from_username(self, username: str) -> Optional[str]:
+        """Get channel ID from username."""
+        try:
+            return _lookup_channel_id_from_username(self.client, username)
+        except _ChannelNotFound:
+            pass
+        except Exception as e:
+            print(f"Error getting channel ID from username: {e}")
+        return None
+    
+    def _get_channel_id_from_handle(self, handle: str) -> Optional[str]:
+        """Get channel ID from handle (@username)."""
+        try:
+            return _lookup_channel_id_from_handle(self.client, handle)
+        except _ChannelNotFound:
+            pass
+        except Exception as e:
+            print(f"Error getting channel ID from handle: {e}")
+        return None
+    
+    async def _api_get(self, client: httpx.AsyncClient, endpoint: str, **params) -> Dict:
+        """Call a YouTube Data API endpoint and return the decoded JSON response.
+        
+        videos and channels responses are stored with their ETag and revalidated
+        with If-None-Match, so unchanged resources come back as an empty 304.
+        """
+        cache_key = None
+        stored = None
+        headers = {}
+        if endpoint in ETAG_CACHED_ENDPOINTS:
+            cache_key = ('etag', endpoint, params.get('part'), ','.join(sorted(params['id'].split(','))))
+            stored = _cache.get(cache_key)
+            if stored:
+                headers['If-None-Match'] = stored[0]
+        
+        resp = await client.get(endpoint, params=params, headers=headers)
+        if resp.status_code == 304 and stored:
+            return stored[1]
+        resp.raise_for_status()
+        response = resp.json()
+        
+        etag = resp.headers.get('ETag')
+        if cache_key and etag:
+            _cache.set(cache_key, (etag, response), expire=ETAG_CACHE_TTL)
+        return response
+    
+    async def _iter_playlist_pages(self, client: httpx.AsyncClient, playlist_id: str, published_after: str) -> AsyncIterator[Dict]:
+        """Yield playlist pages, requesting the next page while the current one is processed.
+        
+        No further page is requested once a page ends with an upload older than
+        published_after, since uploads are listed newest first.
+        """
+        params = {'part': 'snippet', 'playlistId': playlist_id, 'maxResults': 50}
+        next_page = asyncio.create_task(self._api_get(client, 'playlistItems', **params))
+        try:
+            while next_page:
+                playlist_response = await next_page
+                next_page = None
+                next_page_token = playlist_response.get('nextPageToken')
+                items = playlist_response['items']
+                if items and items[-1]['snippet']['publishedAt'] < published_after:
+                    next_page_token = None
+                if next_page_token:
+                    next_page = asyncio.create_task(
+                        self._api_get(client, 'playlistItems', pageToken=next_page_token, **params)
+                    )
+                yield playlist_response
+        finally:
+            if next_page:
+                next_page.cancel()
+    
+    async def get_video_details(self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore, video_ids: List[str]) -> List[Dict]:
+        """Get the raw videos.list items for a batch of up to 50 videos."""
+        try:
+            async with semaphore:
+                response = await self._api_get(
+                    client,
+                    'videos',
+                    part=self.video_parts,
+                    id=','.join(video_ids)
+                )
+            return response['items']
+        except Exception as e:
+            print(f"Error getting video details: {e}")
+        return []
+    
+    def _determine_video_type(self, duration: str, live_details: Optional[Dict], broadcast_content: str) -> str:
+        """Determine if video is Short, Live, or regular Video."""
+        if live_details or broadcast_content in ['live', 'upcoming']:
+            return 'Live'
+        elif _is_short_duration(duration):
+            return 'Short'
+        else:
+            return 'Video'
+    
+    def _build_video_record(self, video: Dict) -> Dict:
+        """Build the output record for a videos.list item."""
+        duration = video['contentDetails']['duration']
+        video_type = self._determine_video_type(
+            duration,
+            video.get('liveStreamingDetails'),
+            video['snippet'].get('liveBroadcastContent')
+        )
+        
+        return {
+            'video_id': video['id'],
+            'title': video['snippet']['title'],
+            'published_at': video['snippet']['publishedAt'],
+            'views': int(video['statistics'].get('viewCount', 0)),
+            'likes': int(video['statistics'].get('likeCount', 0)),
+            'comments': int(video['statistics'].get('commentCount', 0)),
+            'duration': duration,
+            'type': video_type,
+            'url': f"https://youtube.com/watch?v={video['id']}"
+        }
+    
+    async def get_channel_videos(self, channel_id: str, days: int) -> List[Dict]:
+        """Get all videos from a channel within specified time period."""
+        videos = []
+        published_after = (datetime.utcnow() - timedelta(days=days)).isoformat() + 'Z'
+        
+        try:
+            # With HTTP/2 one connection multiplexes the playlist and videos requests
+            async with httpx.AsyncClient(http2=HTTP2_AVAILABLE, base_url=YOUTUBE_API_URL, params={'key': self.api_key}) as client:
+                response = await self._api_get(client, 'channels', part='contentDetails', id=channel_id)
+                
+                if not response['items']:
+                    return videos
+                
+                uploads_playlist_id = response['items'][0]['contentDetails']['relatedPlaylists']['uploads']
+                
+                video_ids = []
+                async with aclosing(self._iter_playlist_pages(client, uploads_playlist_id, published_after)) as pages:
+                    async for playlist_response in pages:
+                        reached_cutoff = False
+                        for item in playlist_response['items']:
+                            video_published = item['snippet']['publishedAt']
+                            if video_published < published_after:
+                                reached_cutoff = True
+                                break
+                            
+                            video_ids.append(item['snippet']['resourceId']['videoId'])
+                        
+                        # Uploads come back newest first, so every video after the
+                        # first one older than the cutoff is outside the window too
+                        if reached_cutoff:
+                            break
+                
+                # videos.list accepts up to 50 IDs per call; fetch the batches concurrently
+                semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+                batches = await asyncio.gather(*[
+                    self.get_video_details(client, semaphore, video_ids[i:i + VIDEOS_PER_REQUEST])
+                    for i in range(0, len(video_ids), VIDEOS_PER_REQUEST)
+                ])
+            
+            # Parse each item on its own so a malformed one only drops that video
+            for batch in batches:
+                for video in batch:
+                    try:
+                        videos.append(self._build_video_record(video))
+                    except (KeyError, TypeError, ValueError) as e:
+                        print(f"Error getting video details: {e}")
+                
+        except Exception as e:
+            print(f"Error fetching channel videos: {e}")
+        
+        return videos